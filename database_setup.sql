@@ -5,18 +5,19 @@ CREATE DATABASE IF NOT EXISTS task_manager;
 USE task_manager;
 
 -- Create the tasks table with appropriate data types and constraints
+-- (CREATE_TASKS_TABLE_SQL in task_manager.py is a copy -- keep the two in sync)
+-- Indexes match the filter shapes used by the application (status/priority/due date)
+-- and the keyset pagination order (creation_timestamp, task_id)
 CREATE TABLE IF NOT EXISTS tasks (
-    task_id VARCHAR(36) PRIMARY KEY,
+    task_id BINARY(16) PRIMARY KEY,  -- UUID stored as 16 raw bytes
     title VARCHAR(255) NOT NULL,
     description TEXT,
     due_date DATE,
     priority_level ENUM('Low', 'Medium', 'High') NOT NULL,
     status ENUM('Pending', 'In Progress', 'Completed') NOT NULL,
-    creation_timestamp DATETIME NOT NULL
+    creation_timestamp DATETIME NOT NULL,
+    INDEX idx_status_due (status, due_date),
+    INDEX idx_prio_due (priority_level, due_date),
+    INDEX idx_due (due_date),
+    INDEX idx_created_task (creation_timestamp, task_id)
 );
-
--- Optional: Create an index for faster filtering
-CREATE INDEX idx_due_date ON tasks(due_date);
-CREATE INDEX idx_priority ON tasks(priority_level);
-CREATE INDEX idx_status ON tasks(status);
-
@@ -0,0 +1,76 @@
+-- Upgrade a tasks table created by the original database_setup.sql
+-- (task_id VARCHAR(36), single-column indexes) to 16-byte binary UUIDs
+-- and the composite indexes used by the application.
+-- The application runs the same steps automatically at startup (ensure_schema);
+-- MIGRATE_TASK_ID_SQL in task_manager.py is a copy -- keep the two in sync.
+--
+-- The script stops without changing anything if some task_id is not a UUID,
+-- and can be re-run safely after an interrupted run.
+USE task_manager;
+
+DROP PROCEDURE IF EXISTS migrate_task_id_binary;
+
+DELIMITER //
+CREATE PROCEDURE migrate_task_id_binary()
+BEGIN
+    IF (SELECT DATA_TYPE FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'tasks' AND column_name = 'task_id')
+        IN ('varchar', 'char') THEN
+
+        IF (SELECT COUNT(*) FROM tasks
+            WHERE UNHEX(REPLACE(task_id, '-', '')) IS NULL
+               OR LENGTH(UNHEX(REPLACE(task_id, '-', ''))) <> 16) > 0 THEN
+            SIGNAL SQLSTATE '45000'
+                SET MESSAGE_TEXT = 'Some task_id values are not valid UUIDs; fix or remove them first';
+        END IF;
+
+        -- Skipped when resuming after an interrupted run
+        IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_schema = DATABASE() AND table_name = 'tasks'
+                         AND column_name = 'task_id_bin') THEN
+            ALTER TABLE tasks ADD COLUMN task_id_bin BINARY(16) NULL AFTER task_id;
+        END IF;
+
+        UPDATE tasks SET task_id_bin = UNHEX(REPLACE(task_id, '-', ''));
+        ALTER TABLE tasks
+            DROP PRIMARY KEY,
+            DROP COLUMN task_id,
+            CHANGE COLUMN task_id_bin task_id BINARY(16) NOT NULL,
+            ADD PRIMARY KEY (task_id);
+    END IF;
+
+    -- Replace the single-column indexes with the composite ones; the old ones are
+    -- exact duplicates or prefixes and would only add write cost
+    IF EXISTS (SELECT 1 FROM information_schema.statistics
+               WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_due_date') THEN
+        DROP INDEX idx_due_date ON tasks;
+    END IF;
+    IF EXISTS (SELECT 1 FROM information_schema.statistics
+               WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_priority') THEN
+        DROP INDEX idx_priority ON tasks;
+    END IF;
+    IF EXISTS (SELECT 1 FROM information_schema.statistics
+               WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_status') THEN
+        DROP INDEX idx_status ON tasks;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM information_schema.statistics
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_status_due') THEN
+        CREATE INDEX idx_status_due ON tasks (status, due_date);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM information_schema.statistics
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_prio_due') THEN
+        CREATE INDEX idx_prio_due ON tasks (priority_level, due_date);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM information_schema.statistics
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_due') THEN
+        CREATE INDEX idx_due ON tasks (due_date);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM information_schema.statistics
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name = 'idx_created_task') THEN
+        CREATE INDEX idx_created_task ON tasks (creation_timestamp, task_id);
+    END IF;
+END //
+DELIMITER ;
+
+CALL migrate_task_id_binary();
+DROP PROCEDURE migrate_task_id_binary;
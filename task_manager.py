@@ -1,10 +1,117 @@
+import functools
+import io
+import sys
+import threading
+import time
 import uuid
-from datetime import datetime
-import pymysql
-from typing import List, Dict, Optional, Union
+from datetime import date, datetime
+try:
+    # Prefer the C-based mysqlclient driver when installed; fall back to pure-Python PyMySQL
+    import MySQLdb as db_driver
+    from MySQLdb.constants import CLIENT
+    # Send bytes parameters (BINARY(16) task IDs) with the _binary introducer, as PyMySQL does
+    DRIVER_OPTIONS = {"binary_prefix": True}
+except ImportError:
+    import pymysql as db_driver
+    from pymysql.constants import CLIENT
+    DRIVER_OPTIONS = {}
+from dbutils.pooled_db import PooledDB
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
 from enum import Enum
 import config  # Import database configuration from config.py
 
+PAGE_SIZE = 100  # Number of tasks listed per page in the CLI
+TASK_SEPARATOR = "-" * 40
+
+# Fixed SQL statements, built once at import time.
+# Keep "VALUES (" on one line so PyMySQL rewrites executemany as a multi-row INSERT.
+INSERT_TASK_SQL = (
+    "INSERT INTO tasks (task_id, title, description, due_date, priority_level, status, creation_timestamp) "
+    "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+)
+DELETE_TASK_SQL = "DELETE FROM tasks WHERE task_id = %s"
+# Copy of the tasks table in database_setup.sql -- keep the two in sync.
+# Indexes match the get_all_tasks filter shapes.
+CREATE_TASKS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id BINARY(16) PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    due_date DATE,
+    priority_level ENUM('Low', 'Medium', 'High') NOT NULL,
+    status ENUM('Pending', 'In Progress', 'Completed') NOT NULL,
+    creation_timestamp DATETIME NOT NULL,
+    INDEX idx_status_due (status, due_date),
+    INDEX idx_prio_due (priority_level, due_date),
+    INDEX idx_due (due_date),
+    INDEX idx_created_task (creation_timestamp, task_id)
+)
+"""
+TASK_INDEXES = {
+    "idx_status_due": ("status", "due_date"),
+    "idx_prio_due": ("priority_level", "due_date"),
+    "idx_due": ("due_date",),
+    "idx_created_task": ("creation_timestamp", "task_id")
+}
+
+# Converts a VARCHAR(36) task_id (original setup script) to BINARY(16) in place.
+# migrate_task_id_binary.sql repeats these steps for manual runs -- keep the two in sync.
+# Rows whose task_id would not convert to exactly 16 bytes; must be 0 before migrating
+INVALID_TASK_IDS_SQL = (
+    "SELECT COUNT(*) AS invalid FROM tasks "
+    "WHERE UNHEX(REPLACE(task_id, '-', '')) IS NULL OR LENGTH(UNHEX(REPLACE(task_id, '-', ''))) <> 16"
+)
+# The first step is skipped when resuming after an interrupted run (task_id_bin already exists)
+MIGRATE_TASK_ID_SQL = [
+    "ALTER TABLE tasks ADD COLUMN task_id_bin BINARY(16) NULL AFTER task_id",
+    "UPDATE tasks SET task_id_bin = UNHEX(REPLACE(task_id, '-', ''))",
+    "ALTER TABLE tasks DROP PRIMARY KEY, DROP COLUMN task_id, "
+    "CHANGE COLUMN task_id_bin task_id BINARY(16) NOT NULL, ADD PRIMARY KEY (task_id)"
+]
+
+# Guarded so an already-completed task is not rewritten
+MARK_COMPLETED_SQL = "UPDATE tasks SET status = %s WHERE task_id = %s AND status <> %s"
+
+# Hot write statements, prepared server-side once per pooled connection
+PREPARED_STATEMENTS = {
+    "ins_task": INSERT_TASK_SQL.replace("%s", "?"),
+    "del_task": DELETE_TASK_SQL.replace("%s", "?"),
+    "mark_done": MARK_COMPLETED_SQL.replace("%s", "?")
+}
+ER_UNKNOWN_STMT_HANDLER = 1243  # MySQL error raised when EXECUTE names an unprepared statement
+
+def _uuid_to_bytes(value: str) -> bytes:
+    """Convert a UUID string to its 16-byte database form (ValueError if malformed)"""
+    return uuid.UUID(value).bytes
+
+def _uuid_to_str(value: Union[bytes, str]) -> str:
+    """Convert a 16-byte database UUID to its canonical string form (strings pass through)"""
+    if isinstance(value, str):
+        return value
+    return str(uuid.UUID(bytes=bytes(value)))
+
+# Columns update_task may write; keys are interpolated into SQL so they must be checked
+UPDATABLE_COLUMNS = frozenset({"title", "description", "due_date", "priority_level", "status"})
+
+@functools.lru_cache(maxsize=64)
+def _update_sql(keys: tuple) -> str:
+    """
+    Build (and cache) the UPDATE statement for a sorted tuple of column names
+
+    The null-safe <=> guard skips rows whose columns already hold the new values.
+    Values are compared as binary so case- or accent-only edits are not treated
+    as no-ops by the column collation.
+    Parameters: new values, task_id, then the new values again.
+    """
+    unknown = set(keys) - UPDATABLE_COLUMNS
+    if unknown:
+        raise ValueError(f"Cannot update column(s): {', '.join(sorted(unknown))}")
+    return (
+        "UPDATE tasks SET " + ", ".join(f"{key} = %s" for key in keys)
+        + " WHERE task_id = %s AND NOT ("
+        + " AND ".join(f"CAST({key} AS BINARY) <=> CAST(%s AS BINARY)" for key in keys) + ")"
+    )
+
 class PriorityLevel(Enum):
     """Enum representing task priority levels"""
     LOW = "Low"
@@ -17,8 +124,33 @@ class TaskStatus(Enum):
     IN_PROGRESS = "In Progress"
     COMPLETED = "Completed"
 
+# Menu orderings, computed once and reused for every CLI prompt
+PRIORITY_LEVELS = list(PriorityLevel)
+TASK_STATUSES = list(TaskStatus)
+
+# Value -> member lookups used when materializing rows from the database
+_PRIORITY_BY_VALUE = {level.value: level for level in PriorityLevel}
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+# Filterable column -> (equality SQL fragment, value transform); also coerces update values
+_FILTER_SPEC = {
+    "due_date": ("due_date = %s", lambda v: v),
+    "priority_level": ("priority_level = %s", lambda v: v.value if isinstance(v, PriorityLevel) else v),
+    "status": ("status = %s", lambda v: v.value if isinstance(v, TaskStatus) else v)
+}
+
 class Task:
     """Class representing a single task with all required attributes"""
+    __slots__ = (
+        "task_id",
+        "title",
+        "description",
+        "due_date",
+        "priority_level",
+        "status",
+        "creation_timestamp"
+    )
+
     def __init__(
         self,
         title: str,
@@ -74,21 +206,52 @@ class Task:
         Returns:
             Task object
         """
-        return cls(
-            task_id=data["task_id"],
-            title=data["title"],
-            description=data["description"],
-            due_date=data["due_date"],
-            priority_level=PriorityLevel(data["priority_level"]),
-            status=TaskStatus(data["status"]),
-            creation_timestamp=data["creation_timestamp"]
-        )
+        # Bypass __init__: every field is supplied, so no defaults need generating
+        task = cls.__new__(cls)
+        task.task_id = _uuid_to_str(data["task_id"])
+        task.title = data["title"]
+        task.description = data["description"]
+        task.due_date = data["due_date"]
+        task.priority_level = _PRIORITY_BY_VALUE[data["priority_level"]]
+        task.status = _STATUS_BY_VALUE[data["status"]]
+        task.creation_timestamp = data["creation_timestamp"]
+        return task
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Union[str, None]]]) -> List['Task']:
+        """
+        Create Task objects from many database rows at once
+        
+        Equivalent to calling from_dict per row, with lookups hoisted out of the loop.
+        
+        Args:
+            rows: List of dictionaries containing task attributes
+            
+        Returns:
+            List of Task objects
+        """
+        priorities = _PRIORITY_BY_VALUE
+        statuses = _STATUS_BY_VALUE
+        to_str = _uuid_to_str
+        new = cls.__new__
+        tasks = [None] * len(rows)
+        for i, data in enumerate(rows):
+            task = new(cls)
+            task.task_id = to_str(data["task_id"])
+            task.title = data["title"]
+            task.description = data["description"]
+            task.due_date = data["due_date"]
+            task.priority_level = priorities[data["priority_level"]]
+            task.status = statuses[data["status"]]
+            task.creation_timestamp = data["creation_timestamp"]
+            tasks[i] = task
+        return tasks
 
 class DatabaseManager:
-    """Class for managing database connections and queries"""
+    """Class for managing pooled database connections and queries"""
     def __init__(self, host: str, user: str, password: str, database: str):
         """
-        Initialize database connection
+        Initialize database connection pool
         
         Args:
             host: Database host
@@ -97,16 +260,53 @@ class DatabaseManager:
             database: Database name
         """
         try:
-            self.connection = pymysql.connect(
+            connect_args = dict(
                 host=host,
                 user=user,
                 password=password,
                 database=database,
-                cursorclass=pymysql.cursors.DictCursor
+                cursorclass=db_driver.cursors.DictCursor,
+                autocommit=True,
+                **DRIVER_OPTIONS
+            )
+            pool_args = dict(
+                creator=db_driver,
+                maxcached=5,
+                maxconnections=10,
+                blocking=True,
+                ping=1,
+                # No ROLLBACK on every return to the pool: with autocommit the only open
+                # transactions come from begin(), which DBUtils still rolls back itself
+                reset=False
+            )
+            # Connections are checked out per query and returned on close();
+            # ping=1 re-validates a pooled connection before handing it out.
+            # autocommit keeps single statements (and SELECTs) from holding a transaction open.
+            self.pool = PooledDB(mincached=2, **pool_args, **connect_args)
+            # Separate pool with multi-statements enabled, used only by execute_prepared
+            # so stacked queries are never possible on general-purpose connections
+            self.prepared_pool = PooledDB(
+                mincached=1,
+                client_flag=CLIENT.MULTI_STATEMENTS,
+                **pool_args,
+                **connect_args
             )
-        except pymysql.Error as e:
+        except db_driver.Error as e:
             raise ConnectionError(f"Database connection failed: {str(e)}")
 
+        # Short-lived SELECT result cache: (query, params) -> (fetched_at, rows)
+        self._cache: Dict[tuple, Tuple[float, List[Dict]]] = {}
+        self._cache_ttl = 2.0
+        self._cache_max_entries = 32
+        self._cache_generation = 0  # Bumped by every write so in-flight reads are not cached
+        self._cache_lock = threading.Lock()  # Pooled connections allow concurrent callers
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached SELECT results; called around every write"""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.clear()
+
     def execute_query(self, query: str, params: Optional[tuple] = None) -> int:
         """
         Execute a SQL query that doesn't return results (INSERT, UPDATE, DELETE)
@@ -114,15 +314,83 @@ class DatabaseManager:
         Returns:
             Number of affected rows
         """
+        self._invalidate_cache()  # Any write may change cached results
+        connection = self.pool.connection()
         try:
-            with self.connection.cursor() as cursor:
-                affected_rows = cursor.execute(query, params or ())
-                self.connection.commit()
-                return affected_rows  # Always return an integer
-        except pymysql.Error as e:
-            self.connection.rollback()
+            with connection.cursor() as cursor:
+                return cursor.execute(query, params or ())  # Autocommitted; always an integer
+        except db_driver.Error as e:
             raise RuntimeError(f"Query execution failed: {str(e)}")
+        finally:
+            connection.close()  # Return connection to the pool
+            self._invalidate_cache()  # Also drop rows a concurrent read cached mid-write
+
+    def execute_many(self, query: str, seq_of_params: List[tuple]) -> int:
+        """
+        Execute a SQL query once per parameter tuple and commit once (bulk INSERT)
 
+        Args:
+            query: SQL query string
+            seq_of_params: Sequence of parameter tuples
+
+        Returns:
+            Number of affected rows
+        """
+        self._invalidate_cache()
+        connection = self.pool.connection()
+        try:
+            connection.begin()  # Explicit transaction so the whole batch commits once
+            with connection.cursor() as cursor:
+                affected_rows = cursor.executemany(query, seq_of_params)
+                connection.commit()
+                return affected_rows or 0
+        except db_driver.Error as e:
+            connection.rollback()
+            raise RuntimeError(f"Bulk query execution failed: {str(e)}")
+        finally:
+            connection.close()
+            self._invalidate_cache()
+
+    def execute_prepared(self, name: str, params: tuple) -> int:
+        """
+        Execute a server-side prepared statement from PREPARED_STATEMENTS
+        
+        Parameters are bound to session variables and the statement executed in
+        a single multi-statement round trip. The statement is prepared lazily the
+        first time it is used on each pooled connection, so MySQL parses it once
+        per session.
+        
+        Args:
+            name: Prepared statement name
+            params: Parameters for the statement
+            
+        Returns:
+            Number of affected rows
+        """
+        if name not in PREPARED_STATEMENTS:
+            raise ValueError(f"Unknown prepared statement: {name}")
+        self._invalidate_cache()
+        variables = [f"@p{i}" for i in range(len(params))]
+        set_sql = "SET " + ", ".join(f"{var} = %s" for var in variables)
+        execute_sql = f"EXECUTE {name} USING {', '.join(variables)}"
+        connection = self.prepared_pool.connection()
+        try:
+            with connection.cursor() as cursor:
+                try:
+                    cursor.execute(f"{set_sql}; {execute_sql}", params)
+                    cursor.nextset()  # Advance to the EXECUTE result
+                except db_driver.Error as e:
+                    if not (e.args and e.args[0] == ER_UNKNOWN_STMT_HANDLER):
+                        raise
+                    # The variables are already set; prepare and execute together
+                    cursor.execute(f"PREPARE {name} FROM '{PREPARED_STATEMENTS[name]}'; {execute_sql}")
+                    cursor.nextset()
+                return cursor.rowcount
+        except db_driver.Error as e:
+            raise RuntimeError(f"Query execution failed: {str(e)}")
+        finally:
+            connection.close()
+            self._invalidate_cache()
 
     def fetch_query(self, query: str, params: Optional[tuple] = None) -> List[Dict]:
         """
@@ -135,19 +403,162 @@ class DatabaseManager:
         Returns:
             List of result dictionaries
         """
+        connection = self.pool.connection()
         try:
-            with self.connection.cursor() as cursor:
+            with connection.cursor() as cursor:
                 cursor.execute(query, params or ())
                 return cursor.fetchall()
-        except pymysql.Error as e:
+        except db_driver.Error as e:
+            raise RuntimeError(f"Fetch query failed: {str(e)}")
+        finally:
+            connection.close()
+
+    def fetch_query_cached(self, query: str, params: Optional[tuple] = None, ttl: Optional[float] = None) -> List[Dict]:
+        """
+        Execute a SELECT query, reusing results fetched within the last ttl seconds
+        
+        Args:
+            query: SQL query string
+            params: Parameters for the query
+            ttl: Cache lifetime in seconds (defaults to the manager's TTL)
+            
+        Returns:
+            List of result dictionaries
+        """
+        ttl = self._cache_ttl if ttl is None else ttl
+        key = (query, params)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.pop(key, None)
+            if cached and now - cached[0] < ttl:
+                self._cache[key] = cached
+                return cached[1]
+            generation = self._cache_generation
+
+        # Fetch outside the lock so slow queries don't block other readers
+        rows = self.fetch_query(query, params)
+
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return rows  # A write ran during the fetch; these rows may be stale
+
+            # Keep the cache bounded: prune expired entries, then evict the oldest
+            if len(self._cache) >= self._cache_max_entries:
+                for stale in [k for k, (fetched_at, _) in self._cache.items() if now - fetched_at >= self._cache_ttl]:
+                    del self._cache[stale]
+                while len(self._cache) >= self._cache_max_entries:
+                    del self._cache[next(iter(self._cache))]
+            self._cache[key] = (now, rows)
+        return rows
+
+    def fetch_query_stream(self, query: str, params: Optional[tuple] = None, batch: int = 1000) -> Iterator[Dict]:
+        """
+        Execute a SQL query and stream results using an unbuffered server-side cursor
+        
+        Args:
+            query: SQL query string
+            params: Parameters for the query
+            batch: Number of rows fetched from the server per round trip
+            
+        Yields:
+            Result dictionaries, one at a time
+        """
+        connection = self.pool.connection()
+        try:
+            cursor = connection.cursor(db_driver.cursors.SSDictCursor)
+            try:
+                cursor.execute(query, params or ())
+                while True:
+                    rows = cursor.fetchmany(batch)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()  # Drains any unread rows so the connection can be reused
+        except db_driver.Error as e:
             raise RuntimeError(f"Fetch query failed: {str(e)}")
+        finally:
+            connection.close()
+
+    def ensure_schema(self) -> None:
+        """Create the tasks table, migrate older layouts, and bring its indexes up to date"""
+        self.execute_query(CREATE_TASKS_TABLE_SQL)
+        self._migrate_task_id()
+        existing: Dict[str, Tuple[str, ...]] = {}
+        unique = set()
+        for row in self.fetch_query(
+            "SELECT INDEX_NAME AS index_name, COLUMN_NAME AS column_name, NON_UNIQUE AS non_unique "
+            "FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'tasks' AND index_name <> 'PRIMARY' "
+            "ORDER BY index_name, seq_in_index"
+        ):
+            existing[row["index_name"]] = existing.get(row["index_name"], ()) + (row["column_name"],)
+            if not int(row["non_unique"]):
+                unique.add(row["index_name"])
+
+        # Tables created by older setup scripts lack the composite indexes
+        for name, columns in TASK_INDEXES.items():
+            if existing.get(name) == columns or name in unique:
+                continue  # Never drop a UNIQUE index: it enforces a constraint
+            if name in existing:
+                self.execute_query(f"DROP INDEX {name} ON tasks")
+            self.execute_query(f"CREATE INDEX {name} ON tasks ({', '.join(columns)})")
+            existing[name] = columns
+
+        # Drop indexes made redundant by the ones above (e.g. the old single-column
+        # idx_due_date, idx_priority, idx_status) so writes don't maintain duplicates
+        for name, columns in existing.items():
+            if name in TASK_INDEXES or name in unique:
+                continue
+            if any(wanted[:len(columns)] == columns for wanted in TASK_INDEXES.values()):
+                self.execute_query(f"DROP INDEX {name} ON tasks")
+
+    def _migrate_task_id(self) -> None:
+        """
+        Convert a string task_id column (VARCHAR(36)) to BINARY(16) UUIDs
+        
+        Every ID is checked before anything is altered, and a task_id_bin column
+        left behind by an interrupted run is resumed rather than re-added.
+        
+        Raises:
+            RuntimeError: If some task_id values are not UUIDs
+        """
+        columns = {
+            row["column_name"]: row["data_type"].lower() for row in self.fetch_query(
+                "SELECT COLUMN_NAME AS column_name, DATA_TYPE AS data_type FROM information_schema.columns "
+                "WHERE table_schema = DATABASE() AND table_name = 'tasks' "
+                "AND column_name IN ('task_id', 'task_id_bin')"
+            )
+        }
+        resuming = "task_id_bin" in columns
+        if columns.get("task_id") not in ("varchar", "char"):
+            if resuming:
+                self.execute_query("ALTER TABLE tasks DROP COLUMN task_id_bin")
+            return
+
+        invalid = self.fetch_query(INVALID_TASK_IDS_SQL)[0]["invalid"]
+        if invalid:
+            raise RuntimeError(
+                f"Cannot migrate tasks.task_id to BINARY(16): {invalid} row(s) are not valid UUIDs. "
+                "Fix or remove them, then restart."
+            )
+        for statement in MIGRATE_TASK_ID_SQL[1:] if resuming else MIGRATE_TASK_ID_SQL:
+            self.execute_query(statement)
+
+    def __enter__(self) -> 'DatabaseManager':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def close(self) -> None:
-        """Close the database connection"""
+        """Close all pooled database connections"""
         try:
-            if self.connection:
-                self.connection.close()
-        except pymysql.Error as e:
+            if self.pool:
+                self.pool.close()
+            if self.prepared_pool:
+                self.prepared_pool.close()
+        except db_driver.Error as e:
             print(f"Error closing connection: {str(e)}")
 
 class TaskManager:
@@ -163,12 +574,8 @@ class TaskManager:
 
     def add_task(self, task: Task) -> None:
         """Add a new task to the database"""
-        query = """
-        INSERT INTO tasks (task_id, title, description, due_date, priority_level, status, creation_timestamp)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
-        self.db_manager.execute_query(query, (
-            task.task_id,
+        self.db_manager.execute_prepared("ins_task", (
+            _uuid_to_bytes(task.task_id),
             task.title,
             task.description,
             task.due_date,
@@ -177,75 +584,150 @@ class TaskManager:
             task.creation_timestamp
         ))
 
-    def get_all_tasks(self, filters: Optional[Dict] = None) -> List[Task]:
+    def add_tasks(self, tasks: List[Task], batch_size: int = 10000) -> int:
         """
-        Retrieve tasks from database with optional filters
-        
+        Add many tasks to the database using multi-row INSERT statements
+
         Args:
-            filters: Dictionary of filter criteria (due_date, priority_level, status)
-            
+            tasks: List of Task objects
+            batch_size: Maximum number of rows sent per INSERT statement
+
         Returns:
-            List of Task objects
+            Number of inserted rows
         """
-        base_query = "SELECT * FROM tasks"
+        params = [
+            (_uuid_to_bytes(t.task_id), t.title, t.description, t.due_date, t.priority_level.value, t.status.value, t.creation_timestamp)
+            for t in tasks
+        ]
+        inserted = 0
+        for start in range(0, len(params), batch_size):
+            inserted += self.db_manager.execute_many(INSERT_TASK_SQL, params[start:start + batch_size])
+        return inserted
+
+    def _build_filter_conditions(self, filters: Optional[Dict]) -> Tuple[List[str], List]:
+        """Build WHERE clause conditions and parameters from filter criteria"""
+        conditions = []
         params = []
-        
-        # Build WHERE clause based on filters
         if filters:
-            conditions = []
             for key, value in filters.items():
-                if key == "due_date":
-                    conditions.append(f"due_date = %s")
-                    params.append(value)
-                elif key == "priority_level":
-                    conditions.append(f"priority_level = %s")
-                    params.append(value)
-                elif key == "status":
-                    conditions.append(f"status = %s")
-                    params.append(value)
+                spec = _FILTER_SPEC.get(key)
+                if not spec:
+                    continue
+                fragment, transform = spec
+                # Multiple values collapse into a single IN (...) condition
+                if isinstance(value, (list, tuple)):
+                    if not value:
+                        conditions.append("1 = 0")  # Matching any of no values matches nothing
+                        continue
+                    conditions.append(f"{key} IN ({', '.join(['%s'] * len(value))})")
+                    params.extend(transform(v) for v in value)
+                else:
+                    conditions.append(fragment)
+                    params.append(transform(value))
+        return conditions, params
+
+    def get_all_tasks(
+        self,
+        filters: Optional[Dict] = None,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, bytes]] = None
+    ) -> Tuple[List[Task], Optional[Tuple[datetime, bytes]]]:
+        """
+        Retrieve one page of tasks from database with optional filters
+        
+        Args:
+            filters: Dictionary of filter criteria (due_date, priority_level, status);
+                a list or tuple value matches any of its values (an empty one matches nothing)
+            limit: Maximum number of tasks to return (at least 1)
+            after: Keyset cursor (creation_timestamp, raw task_id) returned by the previous page
             
-            if conditions:
-                base_query += " WHERE " + " AND ".join(conditions)
+        Returns:
+            Tuple of (list of Task objects, cursor for the next page or None if no more pages)
+        """
+        if limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
+
+        base_query = "SELECT * FROM tasks"
+        conditions, params = self._build_filter_conditions(filters)
+
+        # Keyset pagination: seek past the last row seen instead of using OFFSET
+        if after:
+            conditions.append("(creation_timestamp, task_id) > (%s, %s)")
+            params.extend(after)
+
+        if conditions:
+            base_query += " WHERE " + " AND ".join(conditions)
+
+        base_query += " ORDER BY creation_timestamp, task_id LIMIT %s"
+        params.append(limit)
         
         # Execute query and convert results to Task objects
-        tasks_data = self.db_manager.fetch_query(base_query, tuple(params)) if params else self.db_manager.fetch_query(base_query)
-        return [Task.from_dict(task) for task in tasks_data]
+        tasks_data = self.db_manager.fetch_query_cached(base_query, tuple(params))
+        tasks = Task.from_rows(tasks_data)
+
+        next_cursor = None
+        if tasks_data and len(tasks_data) == limit:
+            last = tasks_data[-1]
+            next_cursor = (last["creation_timestamp"], last["task_id"])
+        return tasks, next_cursor
+
+    def iter_tasks(self, filters: Optional[Dict] = None) -> Iterator[Task]:
+        """
+        Lazily stream all matching tasks without loading the full result set into memory
+        
+        Args:
+            filters: Dictionary of filter criteria (due_date, priority_level, status)
+            
+        Yields:
+            Task objects in creation order
+        """
+        base_query = "SELECT * FROM tasks"
+        conditions, params = self._build_filter_conditions(filters)
+        if conditions:
+            base_query += " WHERE " + " AND ".join(conditions)
+        base_query += " ORDER BY creation_timestamp, task_id"
+
+        for row in self.db_manager.fetch_query_stream(base_query, tuple(params)):
+            yield Task.from_dict(row)
 
     def update_task(self, task_id: str, updates: Dict) -> bool:
         """Update task attributes"""
         if not updates:
             return False
+        try:
+            key_bytes = _uuid_to_bytes(task_id)
+        except ValueError:
+            return False  # Malformed IDs cannot match any task
 
-        set_clauses = []
+        keys = tuple(sorted(updates))
         params = []
 
-        for key, value in updates.items():
-            if key == "priority_level":
-                set_clauses.append("priority_level = %s")
-                params.append(value.value if isinstance(value, PriorityLevel) else value)
-            elif key == "status":
-                set_clauses.append("status = %s")
-                params.append(value.value if isinstance(value, TaskStatus) else value)
-            else:
-                set_clauses.append(f"{key} = %s")
-                params.append(value)
-
-        params.append(task_id)
+        for key in keys:
+            spec = _FILTER_SPEC.get(key)
+            params.append(spec[1](updates[key]) if spec else updates[key])
 
-        query = f"UPDATE tasks SET {', '.join(set_clauses)} WHERE task_id = %s"
-        affected = self.db_manager.execute_query(query, tuple(params))
+        affected = self.db_manager.execute_query(_update_sql(keys), (*params, key_bytes, *params))
         return affected > 0
 
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from the database"""
-        query = "DELETE FROM tasks WHERE task_id = %s"
-        affected = self.db_manager.execute_query(query, (task_id,))
+        try:
+            key_bytes = _uuid_to_bytes(task_id)
+        except ValueError:
+            return False
+        affected = self.db_manager.execute_prepared("del_task", (key_bytes,))
         return affected > 0
 
-    def mark_task_completed(self, task_id: str) -> None:
-        """Mark a task as completed"""
-        return self.update_task(task_id, {"status": TaskStatus.COMPLETED})
+    def mark_task_completed(self, task_id: str) -> bool:
+        """Mark a task as completed (False if not found or already completed)"""
+        try:
+            key_bytes = _uuid_to_bytes(task_id)
+        except ValueError:
+            return False
+        completed = TaskStatus.COMPLETED.value
+        affected = self.db_manager.execute_prepared("mark_done", (completed, key_bytes, completed))
+        return affected > 0
 
 class TaskManagerCLI:
     """Command-line interface for task management application"""
@@ -257,6 +739,26 @@ class TaskManagerCLI:
             task_manager: TaskManager instance
         """
         self.task_manager = task_manager
+        self._input = input  # Replaced with a line reader in batch mode
+        self._batch = False
+
+    @staticmethod
+    def _parse_choices(text: str, options: List[Enum]) -> List[Enum]:
+        """
+        Map comma-separated menu numbers (e.g. "1,3") to the selected options
+        
+        Raises:
+            ValueError: If an entry is empty or not a number
+            IndexError: If a number is out of range
+        """
+        selected = []
+        for part in text.split(","):
+            index = int(part) - 1
+            if index < 0:
+                raise IndexError(index)
+            if options[index] not in selected:
+                selected.append(options[index])
+        return selected
 
     def display_menu(self) -> None:
         """Display the main menu options"""
@@ -271,28 +773,29 @@ class TaskManagerCLI:
     def add_task(self) -> None:
         """Handle adding a new task"""
         print("\nAdd a New Task")
-        title = input("Title: ").strip()
+        title = self._input("Title: ").strip()
         if not title:
             print("Error: Title cannot be empty!")
             return
             
-        description = input("Description: ").strip()
-        due_date = input("Due Date (YYYY-MM-DD): ").strip()
+        description = self._input("Description: ").strip()
+        due_date = self._input("Due Date (YYYY-MM-DD): ").strip()
         
-        # Validate date format
+        # Validate date format; store the canonical YYYY-MM-DD form, since Python 3.11+
+        # also accepts other ISO 8601 spellings such as 2024-W01-1 or 20240105
         try:
-            datetime.strptime(due_date, "%Y-%m-%d")
+            due_date = date.fromisoformat(due_date).isoformat()
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
             return
         
         print("Priority Level:")
-        for i, level in enumerate(PriorityLevel, 1):
+        for i, level in enumerate(PRIORITY_LEVELS, 1):
             print(f"{i}. {level.value}")
-        priority_choice = input("Select priority (1-3): ").strip()
+        priority_choice = self._input("Select priority (1-3): ").strip()
         
         try:
-            priority_level = list(PriorityLevel)[int(priority_choice) - 1]
+            priority_level = PRIORITY_LEVELS[int(priority_choice) - 1]
         except (ValueError, IndexError):
             print("Invalid priority selection. Using 'Medium' as default.")
             priority_level = PriorityLevel.MEDIUM
@@ -309,137 +812,178 @@ class TaskManagerCLI:
         print("2. Filter by due date")
         print("3. Filter by priority")
         print("4. Filter by status")
-        filter_choice = input("Select filter option (1-4): ").strip()
+        filter_choice = self._input("Select filter option (1-4): ").strip()
         
         filters = {}
         if filter_choice == "2":
-            due_date = input("Enter due date to filter (YYYY-MM-DD): ").strip()
+            due_date = self._input("Enter due date to filter (YYYY-MM-DD): ").strip()
             try:
-                datetime.strptime(due_date, "%Y-%m-%d")
-                filters["due_date"] = due_date
+                filters["due_date"] = date.fromisoformat(due_date).isoformat()
             except ValueError:
                 print("Invalid date format. No date filter applied.")
         elif filter_choice == "3":
             print("Priority Levels:")
-            for i, level in enumerate(PriorityLevel, 1):
+            for i, level in enumerate(PRIORITY_LEVELS, 1):
                 print(f"{i}. {level.value}")
-            priority_choice = input("Select priority to filter (1-3): ").strip()
+            priority_choice = self._input("Select priorities to filter (e.g. 1,3): ").strip()
             try:
-                priority_level = list(PriorityLevel)[int(priority_choice) - 1]
-                filters["priority_level"] = priority_level.value
+                filters["priority_level"] = [level.value for level in self._parse_choices(priority_choice, PRIORITY_LEVELS)]
             except (ValueError, IndexError):
                 print("Invalid priority selection. No priority filter applied.")
         elif filter_choice == "4":
             print("Status Options:")
-            for i, status in enumerate(TaskStatus, 1):
+            for i, status in enumerate(TASK_STATUSES, 1):
                 print(f"{i}. {status.value}")
-            status_choice = input("Select status to filter (1-3): ").strip()
+            status_choice = self._input("Select statuses to filter (e.g. 1,2): ").strip()
             try:
-                status = list(TaskStatus)[int(status_choice) - 1]
-                filters["status"] = status.value
+                filters["status"] = [status.value for status in self._parse_choices(status_choice, TASK_STATUSES)]
             except (ValueError, IndexError):
                 print("Invalid status selection. No status filter applied.")
         
-        # Retrieve and display tasks
+        if self._batch:
+            self._stream_tasks(filters)
+            return
+        
+        # Retrieve and display tasks one page at a time
+        after = None
+        shown = 0
+        while True:
+            try:
+                tasks, after = self.task_manager.get_all_tasks(filters, limit=PAGE_SIZE, after=after)
+            except Exception as e:
+                print(f"Error retrieving tasks: {str(e)}")
+                return
+            
+            if not tasks and not shown:
+                print("No tasks found.")
+                return
+            
+            # Build the whole page and emit it with a single write
+            buf = []
+            if not shown:
+                buf.append("\nTasks:\n")
+            for i, task in enumerate(tasks, shown + 1):
+                buf.append(self._format_task(i, task))
+            sys.stdout.write("".join(buf))
+            sys.stdout.flush()
+            shown += len(tasks)
+            
+            if after is None:
+                break
+            if self._input("Show more tasks? (y/n): ").strip().lower() != "y":
+                break
+
+    def _stream_tasks(self, filters: Dict) -> None:
+        """Print every matching task as it streams from the database, without paging prompts"""
+        buf = []
+        shown = 0
         try:
-            tasks = self.task_manager.get_all_tasks(filters)
+            for shown, task in enumerate(self.task_manager.iter_tasks(filters), 1):
+                if shown == 1:
+                    buf.append("\nTasks:\n")
+                buf.append(self._format_task(shown, task))
+                if len(buf) >= PAGE_SIZE:
+                    sys.stdout.write("".join(buf))
+                    buf.clear()
         except Exception as e:
+            sys.stdout.write("".join(buf))
             print(f"Error retrieving tasks: {str(e)}")
             return
         
-        if not tasks:
+        sys.stdout.write("".join(buf))
+        if not shown:
             print("No tasks found.")
-            return
-        
-        print("\nTasks:")
-        for i, task in enumerate(tasks, 1):
-            print(f"{i}. ID: {task.task_id}")
-            print(f"   Title: {task.title}")
-            print(f"   Description: {task.description}")
-            print(f"   Due Date: {task.due_date}")
-            print(f"   Priority: {task.priority_level.value}")
-            print(f"   Status: {task.status.value}")
-            print(f"   Created: {task.creation_timestamp}")
-            print("-" * 40)
+
+    @staticmethod
+    def _format_task(index: int, task: Task) -> str:
+        """Format one task for the task listing"""
+        return (
+            f"{index}. ID: {task.task_id}\n"
+            f"   Title: {task.title}\n"
+            f"   Description: {task.description}\n"
+            f"   Due Date: {task.due_date}\n"
+            f"   Priority: {task.priority_level.value}\n"
+            f"   Status: {task.status.value}\n"
+            f"   Created: {task.creation_timestamp}\n"
+            f"{TASK_SEPARATOR}\n"
+        )
 
     def update_task(self) -> None:
         """Update an existing task"""
-        task_id = input("Enter task ID to update: ").strip()
+        task_id = self._input("Enter task ID to update: ").strip()
         if not task_id:
             print("Error: Task ID cannot be empty!")
             return
         
-        try:
-            success = self.task_manager.mark_task_completed(task_id)
-            if success:
-                print("✅ Task marked as completed!")
-            else:
-                print("⚠️ No task found with that ID. Nothing was updated.")
-        except Exception as e:
-            print(f"Error marking task as completed: {str(e)}")
-        
         print("\nSelect field to update:")
         print("1. Title")
         print("2. Description")
         print("3. Due Date")
         print("4. Priority Level")
         print("5. Status")
-        field_choice = input("Select field (1-5): ").strip()
+        print("6. Mark as completed")
+        field_choice = self._input("Select field (1-6): ").strip()
         
         updates = {}
         if field_choice == "1":
-            new_title = input("New title: ").strip()
+            new_title = self._input("New title: ").strip()
             if not new_title:
                 print("Error: Title cannot be empty!")
                 return
             updates["title"] = new_title
         elif field_choice == "2":
-            updates["description"] = input("New description: ").strip()
+            updates["description"] = self._input("New description: ").strip()
         elif field_choice == "3":
-            new_date = input("New due date (YYYY-MM-DD): ").strip()
+            new_date = self._input("New due date (YYYY-MM-DD): ").strip()
             try:
-                datetime.strptime(new_date, "%Y-%m-%d")
-                updates["due_date"] = new_date
+                updates["due_date"] = date.fromisoformat(new_date).isoformat()
             except ValueError:
                 print("Invalid date format. Update cancelled.")
                 return
         elif field_choice == "4":
             print("Priority Levels:")
-            for i, level in enumerate(PriorityLevel, 1):
+            for i, level in enumerate(PRIORITY_LEVELS, 1):
                 print(f"{i}. {level.value}")
-            priority_choice = input("Select new priority (1-3): ").strip()
+            priority_choice = self._input("Select new priority (1-3): ").strip()
             try:
-                updates["priority_level"] = list(PriorityLevel)[int(priority_choice) - 1]
+                updates["priority_level"] = PRIORITY_LEVELS[int(priority_choice) - 1]
             except (ValueError, IndexError):
                 print("Invalid priority selection. Update cancelled.")
                 return
         elif field_choice == "5":
             print("Status Options:")
-            for i, status in enumerate(TaskStatus, 1):
+            for i, status in enumerate(TASK_STATUSES, 1):
                 print(f"{i}. {status.value}")
-            status_choice = input("Select new status (1-3): ").strip()
+            status_choice = self._input("Select new status (1-3): ").strip()
             try:
-                updates["status"] = list(TaskStatus)[int(status_choice) - 1]
+                updates["status"] = TASK_STATUSES[int(status_choice) - 1]
             except (ValueError, IndexError):
                 print("Invalid status selection. Update cancelled.")
                 return
+        elif field_choice == "6":
+            updates["status"] = TaskStatus.COMPLETED
         else:
             print("Invalid field selection. Update cancelled.")
             return
         
+        # Fold completion into the same UPDATE instead of a separate round trip
+        if "status" not in updates:
+            if self._input("Also mark task as completed? (y/n): ").strip().lower() == "y":
+                updates["status"] = TaskStatus.COMPLETED
+        
         # Perform update
         try:
             success = self.task_manager.update_task(task_id, updates)
             if success:
                 print("✅ Task updated successfully!")
             else:
-                print("⚠️ No task found with that ID. Update failed.")
+                print("⚠️ No task found with that ID, or nothing changed.")
         except Exception as e:
             print(f"Error updating task: {str(e)}")
 
     def mark_task_completed(self) -> None:
         """Mark a task as completed"""
-        task_id = input("Enter task ID to mark as completed: ").strip()
+        task_id = self._input("Enter task ID to mark as completed: ").strip()
         if not task_id:
             print("Error: Task ID cannot be empty!")
             return
@@ -449,13 +993,13 @@ class TaskManagerCLI:
             if success:
                 print("✅ Task marked as completed!")
             else:
-                print("⚠️ No task found with that ID. Nothing was updated.")
+                print("⚠️ No task found with that ID, or it is already completed.")
         except Exception as e:
             print(f"Error marking task as completed: {str(e)}")
 
     def delete_task(self) -> None:
         """Delete a task"""
-        task_id = input("Enter task ID to delete: ").strip()
+        task_id = self._input("Enter task ID to delete: ").strip()
         if not task_id:
             print("Error: Task ID cannot be empty!")
             return
@@ -470,55 +1014,111 @@ class TaskManagerCLI:
             print(f"Error deleting task: {str(e)}")
 
 
+    def _dispatch(self, choice: str) -> bool:
+        """
+        Run the handler for a main menu choice
+        
+        Returns:
+            False when the user chose to exit, True otherwise
+        """
+        if choice == "1":
+            self.add_task()
+        elif choice == "2":
+            self.list_tasks()
+        elif choice == "3":
+            self.update_task()
+        elif choice == "4":
+            self.mark_task_completed()
+        elif choice == "5":
+            self.delete_task()
+        elif choice == "6":
+            print("Exiting application. Goodbye!")
+            return False
+        else:
+            print("Invalid choice. Please select a number between 1 and 6.")
+        return True
+
     def run(self) -> None:
         """Main application loop"""
         while True:
             try:
                 self.display_menu()
-                choice = input("Select an option (1-6): ").strip()
-                
-                if choice == "1":
-                    self.add_task()
-                elif choice == "2":
-                    self.list_tasks()
-                elif choice == "3":
-                    self.update_task()
-                elif choice == "4":
-                    self.mark_task_completed()
-                elif choice == "5":
-                    self.delete_task()
-                elif choice == "6":
-                    print("Exiting application. Goodbye!")
+                choice = self._input("Select an option (1-6): ").strip()
+                if not self._dispatch(choice):
                     break
-                else:
-                    print("Invalid choice. Please select a number between 1 and 6.")
             except KeyboardInterrupt:
                 print("\nOperation cancelled by user.")
             except Exception as e:
                 print(f"An unexpected error occurred: {str(e)}")
 
+    def run_batch(self, commands: Iterable[str]) -> None:
+        """
+        Run menu commands from an iterable of lines (e.g. piped stdin) without prompting
+        
+        Menu choices and the field values they ask for are read from the same
+        lines, in the order the interactive prompts would request them.
+        Task listings stream every matching task without "Show more" prompts.
+        Output is block-buffered (not flushed per line or per listed page)
+        and flushed when the batch ends.
+        
+        Args:
+            commands: Lines of input, one answer per line
+        """
+        lines = (line.rstrip("\r\n") for line in commands)
+        self._input = lambda prompt="": next(lines)
+        self._batch = True
+        
+        sys.stdout.flush()
+        original_stdout = sys.stdout
+        sys.stdout = io.TextIOWrapper(
+            original_stdout.buffer,
+            encoding=original_stdout.encoding,
+            errors=original_stdout.errors,
+            line_buffering=False
+        )
+        try:
+            for choice in lines:
+                choice = choice.strip()
+                if not choice:
+                    continue
+                try:
+                    if not self._dispatch(choice):
+                        break
+                except StopIteration:
+                    print("Input ended in the middle of a command.")
+                    break
+                except Exception as e:
+                    print(f"An unexpected error occurred: {str(e)}")
+        finally:
+            sys.stdout.flush()
+            sys.stdout.detach()  # Leave the underlying buffer open for the original stream
+            sys.stdout = original_stdout
+            self._input = input
+            self._batch = False
+
 def main():
     """Main function to start the application"""
     try:
-        # Initialize database connection
-        db_manager = DatabaseManager(
+        # Initialize database connection; closed automatically on exit
+        with DatabaseManager(
             host=config.DB_HOST,
             user=config.DB_USER,
             password=config.DB_PASSWORD,
             database=config.DB_NAME
-        )
-        
-        # Initialize task manager and CLI
-        task_manager = TaskManager(db_manager)
-        cli = TaskManagerCLI(task_manager)
-        
-        # Start CLI
-        cli.run()
+        ) as db_manager:
+            db_manager.ensure_schema()
+            
+            # Initialize task manager and CLI
+            task_manager = TaskManager(db_manager)
+            cli = TaskManagerCLI(task_manager)
+            
+            # Start CLI; piped input runs as a batch of commands
+            if sys.stdin.isatty():
+                cli.run()
+            else:
+                cli.run_batch(sys.stdin)
     except Exception as e:
         print(f"Failed to initialize application: {str(e)}")
-    finally:
-        if 'db_manager' in locals():
-            db_manager.close()
 
 if __name__ == "__main__":
     main()